@@ -3,7 +3,7 @@ from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import MappedAsDataclass
 from sqlalchemy.orm import sessionmaker
 
-from earthgazer.settings import EarthGazerSettings
+from earthgazer.settings import get_settings
 from earthgazer.utils import Singleton
 
 
@@ -13,6 +13,6 @@ class Base(DeclarativeBase, MappedAsDataclass):
 
 class DatabaseManager(metaclass=Singleton):
     def __init__(self):
-        self.engine = create_engine(str(EarthGazerSettings().database_manager.url))  # type: ignore
+        self.engine = create_engine(str(get_settings().database_manager.url))  # type: ignore
         Base.metadata.create_all(self.engine)
         self.session_factory = sessionmaker(bind=self.engine)
@@ -5,11 +5,28 @@ import jinja2
 from earthgazer.location import Location
 from earthgazer.platforms import Platform
 
+queries_dir = Path(__file__).parent.parent / "queries"
+sql_environment = jinja2.Environment(loader=jinja2.FileSystemLoader(queries_dir, encoding="utf-8"), autoescape=True)
 
-def render_bigquery_template(platform: Platform, location: Location):
-    queries_dir = Path(__file__).parent.parent / "queries"
-    sql_environment = jinja2.Environment(loader=jinja2.FileSystemLoader(queries_dir, encoding="utf-8"), autoescape=True)
+_bigquery_string_escapes = {code: f"\\x{code:02x}" for code in range(0x20)}
+_bigquery_string_escapes.update({ord("\\"): "\\\\", ord("'"): "\\'", ord("\n"): "\\n", ord("\r"): "\\r", ord("\t"): "\\t"})
+
+
+def _bigquery_string_literal(value: str) -> str:
+    return f"'{value.translate(_bigquery_string_escapes)}'"
+
+
+def render_bigquery_template(platform: Platform, location: Location, include_location_name: bool = False):
     mappings = {}
     mappings.update(platform.bigquery_attribute_mapping)
     mappings.update(location.as_dict)
+    if include_location_name:
+        mappings["include_location_name"] = True
+        mappings["location_name_literal"] = _bigquery_string_literal(location.name)
     return sql_environment.get_template("bigquery_get_locations.sql").render(**mappings)
+
+
+def render_bigquery_union(platform: Platform, locations: list[Location]):
+    if not locations:
+        raise ValueError(f"At least one location is required to render a {platform.name} query")
+    return "\nUNION ALL\n".join(render_bigquery_template(platform, location, include_location_name=True) for location in locations)
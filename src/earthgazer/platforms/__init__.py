@@ -5,6 +5,8 @@ import earthgazer.definitions
 
 
 class Band:
+    __slots__ = ("description", "name", "resolution", "wavelength")
+
     def __init__(self, name: str, description: str | None, wavelength: float | None, resolution: float | None):
         self.name = name
         self.description = description
@@ -20,12 +22,17 @@ class Platform(ABC):
     bigquery_attribute_mapping: dict
     bands: list[Band]
     athmospheric_reference_level: str
+    _band_index: dict[str, Band]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._band_index = {band.name: band for band in getattr(cls, "bands", [])}
 
     def get_band_by_name(self, name: str) -> Band:
-        for band in self.bands:
-            if band.name == name:
-                return band
-        raise ValueError(f"Band {name} not found in {self.name}")
+        try:
+            return self._band_index[name]
+        except KeyError:
+            raise ValueError(f"Band {name} not found in {self.name}") from None
 
     @abstractmethod
     def calculate_radiometric_measure(**kwargs) -> earthgazer.definitions.RadiometricMeasure:
@@ -1,4 +1,6 @@
+import functools
 import logging
+import os
 from pathlib import Path
 from typing import ClassVar
 
@@ -8,7 +10,24 @@ from pydantic_settings import BaseSettings
 from pydantic_settings import SettingsConfigDict
 from sqlalchemy import URL
 
-logging.basicConfig(level=logging.DEBUG)
+
+def _parse_log_level(value: str) -> int | None:
+    value = value.strip()
+    try:
+        level = int(value)
+    except ValueError:
+        pass
+    else:
+        return level if level >= 0 else None
+    level = logging.getLevelName(value.upper())
+    return level if isinstance(level, int) else None
+
+
+_log_level_setting = os.environ.get("EARTHGAZER_LOG_LEVEL", "INFO")
+_log_level = _parse_log_level(_log_level_setting)
+logging.basicConfig(level=logging.INFO if _log_level is None else _log_level)
+if _log_level is None:
+    logging.warning("Unknown EARTHGAZER_LOG_LEVEL %r, falling back to INFO", _log_level_setting)
 
 
 class FileManagerSettings(BaseSettings, extra="allow"):
@@ -55,3 +74,8 @@ class EarthGazerSettings(BaseSettings):
     @classmethod
     def path_validator(cls, path: Path):
         path.mkdir(parents=True, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> EarthGazerSettings:
+    return EarthGazerSettings()
@@ -13,6 +13,9 @@ SELECT
     {{ wrs_path | safe }} AS wrs_path,
     {{ wrs_row | safe }} AS wrs_row,
     {{ data_type | safe }} AS data_type
+    {%- if include_location_name %},
+    {{ location_name_literal | safe }} AS location_name
+    {%- endif %}
 FROM {{ bigquery_path }}
 WHERE
     {{ sensing_time }} >= '{{ location_monitoring_start }}' AND
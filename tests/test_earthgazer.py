@@ -1,2 +1,86 @@
+import logging
+
+import pytest
+
+from earthgazer.location import Location
+from earthgazer.operations import render_bigquery_template
+from earthgazer.operations import render_bigquery_union
+from earthgazer.platforms.landsat_8 import Landsat_8
+from earthgazer.platforms.sentinel_2 import Sentinel_2
+from earthgazer.settings import _parse_log_level
+from earthgazer.utils import Singleton
+
+
 def test_main():
     assert 0 == 0
+
+
+def test_render_bigquery_union():
+    locations = [Location(name="A", latitude=19.0, longitude=-98.6), Location(name="B", latitude=20.0, longitude=-99.0)]
+    query = render_bigquery_union(Sentinel_2(), locations)
+    assert query.count("UNION ALL") == 1
+    assert "'A' AS location_name" in query
+    assert "'B' AS location_name" in query
+
+
+def test_render_bigquery_template_has_no_location_name():
+    query = render_bigquery_template(Sentinel_2(), Location(name="A", latitude=19.0, longitude=-98.6))
+    assert "location_name" not in query
+    assert "AS data_type\nFROM" in query
+
+
+def test_render_bigquery_union_landsat():
+    locations = [Location(name="A", latitude=19.0, longitude=-98.6), Location(name="B", latitude=20.0, longitude=-99.0)]
+    query = render_bigquery_union(Landsat_8(), locations)
+    assert query.count("UNION ALL") == 1
+    assert query.count('spacecraft_id = "LANDSAT_8" AND') == 2
+    assert "FROM bigquery-public-data.cloud_storage_geo_index.landsat_index" in query
+
+
+def test_render_bigquery_union_requires_locations():
+    with pytest.raises(ValueError, match="At least one location"):
+        render_bigquery_union(Sentinel_2(), [])
+
+
+def test_render_bigquery_union_escapes_location_name():
+    query = render_bigquery_union(Sentinel_2(), [Location(name="O'Hare & <Lake> \\", latitude=41.9, longitude=-87.9)])
+    assert "'O\\'Hare & <Lake> \\\\' AS location_name" in query
+
+    query = render_bigquery_union(Sentinel_2(), [Location(name="Lake\r\nShore\tNorth\x01", latitude=41.9, longitude=-87.9)])
+    assert "'Lake\\r\\nShore\\tNorth\\x01' AS location_name" in query
+
+
+def test_get_band_by_name():
+    platform = Sentinel_2()
+    assert platform.get_band_by_name("B8A").description == "NIR"
+    with pytest.raises(ValueError, match="B99"):
+        platform.get_band_by_name("B99")
+
+
+def test_nested_singletons():
+    class Inner(metaclass=Singleton):
+        pass
+
+    class Outer(metaclass=Singleton):
+        def __init__(self):
+            self.inner = Inner()
+
+    assert Outer().inner is Inner()
+    assert Outer() is Outer()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("debug", logging.DEBUG),
+        (" WARNING ", logging.WARNING),
+        ("10", 10),
+        ("+10", 10),
+        ("verbose", None),
+        ("--10", None),
+        ("-5", None),
+        ("²", None),
+    ],
+)
+def test_parse_log_level(value, expected):
+    assert _parse_log_level(value) == expected